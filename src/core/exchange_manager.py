@@ -5,10 +5,12 @@ This module provides integration with CCXT (CryptoCurrency eXchange Trading) lib
 for managing cryptocurrency exchange connections and operations.
 """
 
+import asyncio
 import logging
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from typing import Dict, List, Optional, Any, Union
 from abc import ABC, abstractmethod
-import ccxt
 
 logger = logging.getLogger(__name__)
 
@@ -19,6 +21,8 @@ class ExchangeManager(ABC):
     Defines the interface for exchange operations.
     """
 
+    __slots__ = ()
+
     @abstractmethod
     def connect(self) -> bool:
         """Connect to the exchange."""
@@ -56,6 +60,23 @@ class CCXTExchangeManager(ExchangeManager):
     Provides unified interface to multiple cryptocurrency exchanges via CCXT library.
     """
 
+    __slots__ = (
+        'exchange_name',
+        'api_key',
+        'api_secret',
+        'passphrase',
+        'exchange',
+        'is_connected',
+        'config',
+        '_balance_cache',
+        '_balance_cache_time',
+        '_markets_cache',
+    )
+
+    # Balances only move when orders fill, so a short TTL lets a burst of
+    # lookups share one REST round-trip without serving stale data for long.
+    BALANCE_CACHE_TTL = 2.0
+
     def __init__(self, exchange_name: str, api_key: str, api_secret: str, passphrase: Optional[str] = None, **kwargs):
         """
         Initialize CCXT Exchange Manager.
@@ -74,8 +95,11 @@ class CCXTExchangeManager(ExchangeManager):
         self.exchange = None
         self.is_connected = False
         self.config = kwargs
+        self._balance_cache: Optional[Dict[str, Any]] = None
+        self._balance_cache_time = 0.0
+        self._markets_cache: Optional[Dict[str, Any]] = None
 
-        logger.info(f"Initializing CCXT Exchange Manager for {self.exchange_name}")
+        logger.info("Initializing CCXT Exchange Manager for %s", self.exchange_name)
 
     def connect(self) -> bool:
         """
@@ -85,6 +109,10 @@ class CCXTExchangeManager(ExchangeManager):
             bool: True if connection successful, False otherwise
         """
         try:
+            # Imported here so processes that never connect (tests, dry
+            # runs) don't pay for loading CCXT's full exchange registry.
+            import ccxt
+
             exchange_class = getattr(ccxt, self.exchange_name)
             config = {
                 'apiKey': self.api_key,
@@ -98,14 +126,14 @@ class CCXTExchangeManager(ExchangeManager):
 
             self.exchange = exchange_class(config)
             self.is_connected = True
-            logger.info(f"Successfully connected to {self.exchange_name}")
+            logger.info("Successfully connected to %s", self.exchange_name)
             return True
 
         except AttributeError:
-            logger.error(f"Exchange '{self.exchange_name}' not supported by CCXT")
+            logger.error("Exchange '%s' not supported by CCXT", self.exchange_name)
             return False
         except Exception as e:
-            logger.error(f"Failed to connect to {self.exchange_name}: {str(e)}")
+            logger.error("Failed to connect to %s: %s", self.exchange_name, e)
             return False
 
     def disconnect(self) -> bool:
@@ -118,16 +146,21 @@ class CCXTExchangeManager(ExchangeManager):
         try:
             if self.exchange:
                 self.is_connected = False
-                logger.info(f"Disconnected from {self.exchange_name}")
+                logger.info("Disconnected from %s", self.exchange_name)
             return True
         except Exception as e:
-            logger.error(f"Error disconnecting from {self.exchange_name}: {str(e)}")
+            logger.error("Error disconnecting from %s: %s", self.exchange_name, e)
             return False
 
     def get_balance(self) -> Dict[str, Any]:
         """
         Fetch account balance from the exchange.
 
+        Responses are cached for BALANCE_CACHE_TTL seconds so consecutive
+        calls (e.g., sizing several orders in one pass) reuse a single
+        round-trip. The cache is invalidated whenever an order is placed
+        or cancelled.
+
         Returns:
             Dict containing account balance information
         """
@@ -135,14 +168,52 @@ class CCXTExchangeManager(ExchangeManager):
             logger.error("Not connected to exchange")
             return {}
 
+        if self._balance_cache is not None and time.monotonic() - self._balance_cache_time < self.BALANCE_CACHE_TTL:
+            return self._balance_cache
+
         try:
             balance = self.exchange.fetch_balance()
-            logger.info(f"Fetched balance from {self.exchange_name}")
+            self._balance_cache = balance
+            self._balance_cache_time = time.monotonic()
+            logger.info("Fetched balance from %s", self.exchange_name)
             return balance
         except Exception as e:
-            logger.error(f"Error fetching balance: {str(e)}")
+            logger.error("Error fetching balance: %s", e)
             return {}
 
+    def _invalidate_balance_cache(self) -> None:
+        """Drop the cached balance after an operation that changes it."""
+        self._balance_cache = None
+
+    def get_asset_balance(self, asset: str) -> float:
+        """
+        Get the free balance of a single asset.
+
+        Uses the asset-keyed mappings CCXT returns from fetch_balance,
+        so the lookup is a single dict access rather than a scan over
+        all currencies. Both the unified 'free' mapping and the per-asset
+        layout (balance['USDT']['free']) are supported.
+
+        Args:
+            asset: Asset code (e.g., 'USDT', 'BTC')
+
+        Returns:
+            Free balance for the asset, or 0.0 if unavailable
+        """
+        balance = self.get_balance()
+        if not balance:
+            return 0.0
+
+        free = balance.get('free')
+        if isinstance(free, dict) and asset in free:
+            return float(free[asset] or 0.0)
+
+        entry = balance.get(asset)
+        if isinstance(entry, dict):
+            return float(entry.get('free') or 0.0)
+
+        return 0.0
+
     def get_ticker(self, symbol: str) -> Dict[str, Any]:
         """
         Get ticker information for a trading pair.
@@ -159,10 +230,10 @@ class CCXTExchangeManager(ExchangeManager):
 
         try:
             ticker = self.exchange.fetch_ticker(symbol)
-            logger.debug(f"Fetched ticker for {symbol}")
+            logger.debug("Fetched ticker for %s", symbol)
             return ticker
         except Exception as e:
-            logger.error(f"Error fetching ticker for {symbol}: {str(e)}")
+            logger.error("Error fetching ticker for %s: %s", symbol, e)
             return {}
 
     def get_orderbook(self, symbol: str, limit: Optional[int] = None) -> Dict[str, Any]:
@@ -182,10 +253,10 @@ class CCXTExchangeManager(ExchangeManager):
 
         try:
             orderbook = self.exchange.fetch_order_book(symbol, limit=limit)
-            logger.debug(f"Fetched orderbook for {symbol}")
+            logger.debug("Fetched orderbook for %s", symbol)
             return orderbook
         except Exception as e:
-            logger.error(f"Error fetching orderbook for {symbol}: {str(e)}")
+            logger.error("Error fetching orderbook for %s: %s", symbol, e)
             return {}
 
     def place_order(self, symbol: str, order_type: str, side: str, amount: float,
@@ -207,12 +278,27 @@ class CCXTExchangeManager(ExchangeManager):
             logger.error("Not connected to exchange")
             return {}
 
+        # Reject obviously invalid orders before paying for a network
+        # round-trip; these checks are pure in-memory work.
+        if side not in ('buy', 'sell'):
+            logger.error("Invalid order side '%s'", side)
+            return {}
+
+        if amount <= 0:
+            logger.error("Invalid order amount %s", amount)
+            return {}
+
+        if order_type == 'limit' and price is None:
+            logger.error("Limit orders require a price")
+            return {}
+
         try:
             order = self.exchange.create_order(symbol, order_type, side, amount, price)
-            logger.info(f"Placed {side} {order_type} order for {symbol}")
+            self._invalidate_balance_cache()
+            logger.info("Placed %s %s order for %s", side, order_type, symbol)
             return order
         except Exception as e:
-            logger.error(f"Error placing order: {str(e)}")
+            logger.error("Error placing order: %s", e)
             return {}
 
     def cancel_order(self, order_id: str, symbol: Optional[str] = None) -> Dict[str, Any]:
@@ -232,12 +318,45 @@ class CCXTExchangeManager(ExchangeManager):
 
         try:
             result = self.exchange.cancel_order(order_id, symbol)
-            logger.info(f"Cancelled order {order_id}")
+            self._invalidate_balance_cache()
+            logger.info("Cancelled order %s", order_id)
             return result
         except Exception as e:
-            logger.error(f"Error cancelling order: {str(e)}")
+            logger.error("Error cancelling order: %s", e)
             return {}
 
+    def cancel_all_orders(self, symbol: Optional[str] = None) -> List[Dict[str, Any]]:
+        """
+        Cancel all open orders, optionally filtered by symbol.
+
+        Each cancellation is an independent network round-trip, so the
+        calls are fanned out over a small thread pool and total wall time
+        is roughly one round-trip instead of one per order.
+
+        Args:
+            symbol: Optional symbol to restrict which orders are cancelled
+
+        Returns:
+            List of cancellation results for orders that were cancelled
+        """
+        open_orders = self.get_open_orders(symbol)
+        if not open_orders:
+            return []
+
+        results = []
+        with ThreadPoolExecutor(max_workers=min(8, len(open_orders))) as pool:
+            futures = [
+                pool.submit(self.cancel_order, order.get('id'), order.get('symbol'))
+                for order in open_orders
+            ]
+            for future in as_completed(futures):
+                result = future.result()
+                if result:
+                    results.append(result)
+
+        logger.info("Cancelled %d of %d open orders", len(results), len(open_orders))
+        return results
+
     def get_open_orders(self, symbol: Optional[str] = None) -> List[Dict[str, Any]]:
         """
         Get list of open orders.
@@ -254,10 +373,10 @@ class CCXTExchangeManager(ExchangeManager):
 
         try:
             orders = self.exchange.fetch_open_orders(symbol)
-            logger.debug(f"Fetched open orders")
+            logger.debug("Fetched open orders")
             return orders
         except Exception as e:
-            logger.error(f"Error fetching open orders: {str(e)}")
+            logger.error("Error fetching open orders: %s", e)
             return []
 
     def get_closed_orders(self, symbol: Optional[str] = None, limit: Optional[int] = None) -> List[Dict[str, Any]]:
@@ -277,10 +396,10 @@ class CCXTExchangeManager(ExchangeManager):
 
         try:
             orders = self.exchange.fetch_closed_orders(symbol, limit=limit)
-            logger.debug(f"Fetched closed orders")
+            logger.debug("Fetched closed orders")
             return orders
         except Exception as e:
-            logger.error(f"Error fetching closed orders: {str(e)}")
+            logger.error("Error fetching closed orders: %s", e)
             return []
 
     def get_supported_symbols(self) -> List[str]:
@@ -296,16 +415,20 @@ class CCXTExchangeManager(ExchangeManager):
 
         try:
             symbols = self.exchange.symbols
-            logger.debug(f"Fetched {len(symbols)} supported symbols")
+            logger.debug("Fetched %d supported symbols", len(symbols))
             return symbols
         except Exception as e:
-            logger.error(f"Error fetching supported symbols: {str(e)}")
+            logger.error("Error fetching supported symbols: %s", e)
             return []
 
     def get_markets(self) -> Dict[str, Any]:
         """
         Get market information for all trading pairs.
 
+        Market metadata (precision, limits) only changes when the exchange
+        updates its listing rules, so the response is fetched once and
+        reused for the lifetime of the manager.
+
         Returns:
             Dict containing market information
         """
@@ -313,14 +436,411 @@ class CCXTExchangeManager(ExchangeManager):
             logger.error("Not connected to exchange")
             return {}
 
+        if self._markets_cache is not None:
+            return self._markets_cache
+
         try:
             markets = self.exchange.fetch_markets()
-            logger.debug(f"Fetched market information")
-            return {market['symbol']: market for market in markets}
+            logger.debug("Fetched market information")
+            self._markets_cache = {market['symbol']: market for market in markets}
+            return self._markets_cache
+        except Exception as e:
+            logger.error("Error fetching markets: %s", e)
+            return {}
+
+    def get_min_order_size(self, symbol: str) -> float:
+        """
+        Get the minimum order amount for a trading pair.
+
+        Reads from the cached market metadata, so repeated calls cost a
+        dict lookup instead of a markets fetch per order.
+
+        Args:
+            symbol: Trading pair symbol (e.g., 'BTC/USDT')
+
+        Returns:
+            Minimum order amount, or 0.0 if unknown
+        """
+        market = self.get_markets().get(symbol)
+        if not market:
+            logger.warning("No market metadata for %s", symbol)
+            return 0.0
+
+        limits = market.get('limits', {})
+        return float(limits.get('amount', {}).get('min') or 0.0)
+
+
+class AsyncCCXTExchangeManager:
+    """
+    Asynchronous CCXT-based exchange manager.
+
+    Mirrors CCXTExchangeManager on top of ccxt.async_support so callers
+    running under asyncio can overlap exchange round-trips (e.g. fetch a
+    balance while an order is in flight) instead of serializing them.
+    """
+
+    __slots__ = (
+        'exchange_name',
+        'api_key',
+        'api_secret',
+        'passphrase',
+        'exchange',
+        'is_connected',
+        'config',
+        '_balance_cache',
+        '_balance_cache_time',
+        '_markets_cache',
+    )
+
+    BALANCE_CACHE_TTL = CCXTExchangeManager.BALANCE_CACHE_TTL
+
+    def __init__(self, exchange_name: str, api_key: str, api_secret: str, passphrase: Optional[str] = None, **kwargs):
+        """
+        Initialize Async CCXT Exchange Manager.
+
+        Args:
+            exchange_name: Name of the exchange (e.g., 'binance', 'coinbase', 'kraken')
+            api_key: API key for the exchange
+            api_secret: API secret for the exchange
+            passphrase: Optional passphrase (required by some exchanges like Coinbase)
+            **kwargs: Additional exchange-specific configuration options
+        """
+        self.exchange_name = exchange_name.lower()
+        self.api_key = api_key
+        self.api_secret = api_secret
+        self.passphrase = passphrase
+        self.exchange = None
+        self.is_connected = False
+        self.config = kwargs
+        self._balance_cache: Optional[Dict[str, Any]] = None
+        self._balance_cache_time = 0.0
+        self._markets_cache: Optional[Dict[str, Any]] = None
+
+        logger.info("Initializing Async CCXT Exchange Manager for %s", self.exchange_name)
+
+    async def connect(self) -> bool:
+        """
+        Connect to the exchange using async CCXT.
+
+        Returns:
+            bool: True if connection successful, False otherwise
+        """
+        try:
+            # Deferred so synchronous-only processes never import the
+            # async stack (aiohttp and friends) at module load.
+            import ccxt.async_support as ccxt_async
+
+            exchange_class = getattr(ccxt_async, self.exchange_name)
+            config = {
+                'apiKey': self.api_key,
+                'secret': self.api_secret,
+                'enableRateLimit': True,
+                **self.config
+            }
+
+            if self.passphrase:
+                config['password'] = self.passphrase
+
+            self.exchange = exchange_class(config)
+            self.is_connected = True
+            logger.info("Successfully connected to %s", self.exchange_name)
+            return True
+
+        except AttributeError:
+            logger.error("Exchange '%s' not supported by CCXT", self.exchange_name)
+            return False
+        except Exception as e:
+            logger.error("Failed to connect to %s: %s", self.exchange_name, e)
+            return False
+
+    async def disconnect(self) -> bool:
+        """
+        Disconnect from the exchange and release its HTTP session.
+
+        Returns:
+            bool: True if disconnection successful
+        """
+        try:
+            if self.exchange:
+                await self.exchange.close()
+                self.is_connected = False
+                logger.info("Disconnected from %s", self.exchange_name)
+            return True
         except Exception as e:
-            logger.error(f"Error fetching markets: {str(e)}")
+            logger.error("Error disconnecting from %s: %s", self.exchange_name, e)
+            return False
+
+    async def get_balance(self) -> Dict[str, Any]:
+        """
+        Fetch account balance from the exchange.
+
+        Uses the same short-TTL cache as the synchronous manager so a
+        burst of lookups shares one round-trip.
+
+        Returns:
+            Dict containing account balance information
+        """
+        if not self.is_connected or not self.exchange:
+            logger.error("Not connected to exchange")
             return {}
 
+        if self._balance_cache is not None and time.monotonic() - self._balance_cache_time < self.BALANCE_CACHE_TTL:
+            return self._balance_cache
+
+        try:
+            balance = await self.exchange.fetch_balance()
+            self._balance_cache = balance
+            self._balance_cache_time = time.monotonic()
+            logger.info("Fetched balance from %s", self.exchange_name)
+            return balance
+        except Exception as e:
+            logger.error("Error fetching balance: %s", e)
+            return {}
+
+    def _invalidate_balance_cache(self) -> None:
+        """Drop the cached balance after an operation that changes it."""
+        self._balance_cache = None
+
+    async def get_asset_balance(self, asset: str) -> float:
+        """
+        Get the free balance of a single asset.
+
+        Args:
+            asset: Asset code (e.g., 'USDT', 'BTC')
+
+        Returns:
+            Free balance for the asset, or 0.0 if unavailable
+        """
+        balance = await self.get_balance()
+        if not balance:
+            return 0.0
+
+        free = balance.get('free')
+        if isinstance(free, dict) and asset in free:
+            return float(free[asset] or 0.0)
+
+        entry = balance.get(asset)
+        if isinstance(entry, dict):
+            return float(entry.get('free') or 0.0)
+
+        return 0.0
+
+    async def get_ticker(self, symbol: str) -> Dict[str, Any]:
+        """
+        Get ticker information for a trading pair.
+
+        Args:
+            symbol: Trading pair symbol (e.g., 'BTC/USDT')
+
+        Returns:
+            Dict containing ticker data
+        """
+        if not self.is_connected or not self.exchange:
+            logger.error("Not connected to exchange")
+            return {}
+
+        try:
+            ticker = await self.exchange.fetch_ticker(symbol)
+            logger.debug("Fetched ticker for %s", symbol)
+            return ticker
+        except Exception as e:
+            logger.error("Error fetching ticker for %s: %s", symbol, e)
+            return {}
+
+    async def get_orderbook(self, symbol: str, limit: Optional[int] = None) -> Dict[str, Any]:
+        """
+        Get order book for a trading pair.
+
+        Args:
+            symbol: Trading pair symbol (e.g., 'BTC/USDT')
+            limit: Optional limit on number of orders to fetch
+
+        Returns:
+            Dict containing order book data
+        """
+        if not self.is_connected or not self.exchange:
+            logger.error("Not connected to exchange")
+            return {}
+
+        try:
+            orderbook = await self.exchange.fetch_order_book(symbol, limit=limit)
+            logger.debug("Fetched orderbook for %s", symbol)
+            return orderbook
+        except Exception as e:
+            logger.error("Error fetching orderbook for %s: %s", symbol, e)
+            return {}
+
+    async def place_order(self, symbol: str, order_type: str, side: str, amount: float,
+                          price: Optional[float] = None) -> Dict[str, Any]:
+        """
+        Place an order on the exchange.
+
+        Args:
+            symbol: Trading pair symbol (e.g., 'BTC/USDT')
+            order_type: Type of order ('limit', 'market', etc.)
+            side: Order side ('buy' or 'sell')
+            amount: Amount to trade
+            price: Price per unit (required for limit orders)
+
+        Returns:
+            Dict containing order information
+        """
+        if not self.is_connected or not self.exchange:
+            logger.error("Not connected to exchange")
+            return {}
+
+        if side not in ('buy', 'sell'):
+            logger.error("Invalid order side '%s'", side)
+            return {}
+
+        if amount <= 0:
+            logger.error("Invalid order amount %s", amount)
+            return {}
+
+        if order_type == 'limit' and price is None:
+            logger.error("Limit orders require a price")
+            return {}
+
+        try:
+            order = await self.exchange.create_order(symbol, order_type, side, amount, price)
+            self._invalidate_balance_cache()
+            logger.info("Placed %s %s order for %s", side, order_type, symbol)
+            return order
+        except Exception as e:
+            logger.error("Error placing order: %s", e)
+            return {}
+
+    async def cancel_order(self, order_id: str, symbol: Optional[str] = None) -> Dict[str, Any]:
+        """
+        Cancel an open order.
+
+        Args:
+            order_id: Order ID to cancel
+            symbol: Trading pair symbol (required by some exchanges)
+
+        Returns:
+            Dict containing cancellation result
+        """
+        if not self.is_connected or not self.exchange:
+            logger.error("Not connected to exchange")
+            return {}
+
+        try:
+            result = await self.exchange.cancel_order(order_id, symbol)
+            self._invalidate_balance_cache()
+            logger.info("Cancelled order %s", order_id)
+            return result
+        except Exception as e:
+            logger.error("Error cancelling order: %s", e)
+            return {}
+
+    async def cancel_all_orders(self, symbol: Optional[str] = None) -> List[Dict[str, Any]]:
+        """
+        Cancel all open orders concurrently via asyncio.gather.
+
+        Args:
+            symbol: Optional symbol to restrict which orders are cancelled
+
+        Returns:
+            List of cancellation results for orders that were cancelled
+        """
+        open_orders = await self.get_open_orders(symbol)
+        if not open_orders:
+            return []
+
+        results = await asyncio.gather(
+            *(self.cancel_order(order.get('id'), order.get('symbol')) for order in open_orders)
+        )
+        cancelled = [result for result in results if result]
+        logger.info("Cancelled %d of %d open orders", len(cancelled), len(open_orders))
+        return cancelled
+
+    async def get_open_orders(self, symbol: Optional[str] = None) -> List[Dict[str, Any]]:
+        """
+        Get list of open orders.
+
+        Args:
+            symbol: Optional symbol to filter orders
+
+        Returns:
+            List of open orders
+        """
+        if not self.is_connected or not self.exchange:
+            logger.error("Not connected to exchange")
+            return []
+
+        try:
+            orders = await self.exchange.fetch_open_orders(symbol)
+            logger.debug("Fetched open orders")
+            return orders
+        except Exception as e:
+            logger.error("Error fetching open orders: %s", e)
+            return []
+
+    async def get_closed_orders(self, symbol: Optional[str] = None, limit: Optional[int] = None) -> List[Dict[str, Any]]:
+        """
+        Get list of closed orders.
+
+        Args:
+            symbol: Optional symbol to filter orders
+            limit: Optional limit on number of orders
+
+        Returns:
+            List of closed orders
+        """
+        if not self.is_connected or not self.exchange:
+            logger.error("Not connected to exchange")
+            return []
+
+        try:
+            orders = await self.exchange.fetch_closed_orders(symbol, limit=limit)
+            logger.debug("Fetched closed orders")
+            return orders
+        except Exception as e:
+            logger.error("Error fetching closed orders: %s", e)
+            return []
+
+    async def get_markets(self) -> Dict[str, Any]:
+        """
+        Get market information for all trading pairs, cached per manager.
+
+        Returns:
+            Dict containing market information
+        """
+        if not self.is_connected or not self.exchange:
+            logger.error("Not connected to exchange")
+            return {}
+
+        if self._markets_cache is not None:
+            return self._markets_cache
+
+        try:
+            markets = await self.exchange.fetch_markets()
+            logger.debug("Fetched market information")
+            self._markets_cache = {market['symbol']: market for market in markets}
+            return self._markets_cache
+        except Exception as e:
+            logger.error("Error fetching markets: %s", e)
+            return {}
+
+    async def get_min_order_size(self, symbol: str) -> float:
+        """
+        Get the minimum order amount for a trading pair from cached metadata.
+
+        Args:
+            symbol: Trading pair symbol (e.g., 'BTC/USDT')
+
+        Returns:
+            Minimum order amount, or 0.0 if unknown
+        """
+        market = (await self.get_markets()).get(symbol)
+        if not market:
+            logger.warning("No market metadata for %s", symbol)
+            return 0.0
+
+        limits = market.get('limits', {})
+        return float(limits.get('amount', {}).get('min') or 0.0)
+
 
 class ExchangeFactory:
     """
@@ -338,7 +858,8 @@ class ExchangeFactory:
 
     @classmethod
     def create_exchange(cls, exchange_name: str, api_key: str, api_secret: str,
-                       passphrase: Optional[str] = None, **kwargs) -> Optional[ExchangeManager]:
+                       passphrase: Optional[str] = None, use_async: bool = False,
+                       **kwargs) -> Optional[Union[ExchangeManager, AsyncCCXTExchangeManager]]:
         """
         Create an exchange manager instance.
 
@@ -347,15 +868,19 @@ class ExchangeFactory:
             api_key: API key
             api_secret: API secret
             passphrase: Optional passphrase
+            use_async: Create an AsyncCCXTExchangeManager for asyncio callers
             **kwargs: Additional configuration options
 
         Returns:
-            ExchangeManager instance or None if exchange not supported
+            Exchange manager instance or None if exchange not supported
         """
         if exchange_name.lower() not in cls._supported_exchanges:
-            logger.error(f"Exchange '{exchange_name}' not supported")
+            logger.error("Exchange '%s' not supported", exchange_name)
             return None
 
+        if use_async:
+            return AsyncCCXTExchangeManager(exchange_name, api_key, api_secret, passphrase, **kwargs)
+
         manager_class = cls._supported_exchanges[exchange_name.lower()]
         return manager_class(exchange_name, api_key, api_secret, passphrase, **kwargs)
 